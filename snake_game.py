@@ -9,14 +9,25 @@ import random
 import sys
 import json
 import os
-from datetime import datetime
+import hashlib
+import wave
 import math
+import array
+import threading
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 try:
     import numpy as np
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
 
+# Surface.fblits (pygame-ce) is a faster blits without per-item options
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
@@ -30,6 +41,16 @@ BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 DARK_GREEN = (0, 128, 0)
 GRAY = (128, 128, 128)
+BRONZE = (205, 127, 50)
+
+# High score table rank labels and colors (gold, silver, bronze)
+RANK_STYLES = {
+    1: ("🥇 1.", YELLOW),
+    2: ("🥈 2.", WHITE),
+    3: ("🥉 3.", BRONZE),
+    4: ("   4.", WHITE),
+    5: ("   5.", WHITE)
+}
 
 # Game settings
 WINDOW_WIDTH = 800
@@ -37,60 +58,153 @@ WINDOW_HEIGHT = 600
 CELL_SIZE = 20
 CELL_WIDTH = WINDOW_WIDTH // CELL_SIZE
 CELL_HEIGHT = WINDOW_HEIGHT // CELL_SIZE
+ALL_CELLS = frozenset((x, y) for x in range(CELL_WIDTH) for y in range(CELL_HEIGHT))
+# Area of the high scores screen holding the score rows
+HIGHSCORE_PANEL_RECT = pygame.Rect(0, 180, WINDOW_WIDTH, 250)
+# Area of the name entry screen holding the input box and character count
+NAME_INPUT_RECT = pygame.Rect(WINDOW_WIDTH // 2 - 150, 290, 300, 75)
 
 # Game speed (frames per second)
 INITIAL_FPS = 5  # Start slower
 MAX_FPS = 20     # Maximum speed
 CURRENT_FPS = INITIAL_FPS
+# The snake moves CURRENT_FPS times a second; input and drawing run at RENDER_FPS
+RENDER_FPS = 60
+MAX_CATCHUP_MOVES = 2  # Missed moves to catch up on after a stall before dropping the rest
+
+# Movement directions: right, down, left, up. Opposite directions are
+# exactly 2 apart, so their indices always XOR to 2.
+DIRS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+DIR_INDEX = {direction: i for i, direction in enumerate(DIRS)}
+
+# Arrow key -> index into DIRS
+DIRECTION_MAP = {
+    pygame.K_UP: 3,
+    pygame.K_DOWN: 1,
+    pygame.K_LEFT: 2,
+    pygame.K_RIGHT: 0
+}
+
+# (Arrow key, Shift held) -> (AudioManager method, label, volume change)
+VOLUME_KEY_MAP = {
+    (pygame.K_UP, False): ('adjust_music_volume', 'Music', 0.1),
+    (pygame.K_DOWN, False): ('adjust_music_volume', 'Music', -0.1),
+    (pygame.K_UP, True): ('adjust_sfx_volume', 'SFX', 0.1),
+    (pygame.K_DOWN, True): ('adjust_sfx_volume', 'SFX', -0.1)
+}
 
 # High score file
 HIGHSCORE_FILE = 'snake_highscores.json'
 
+# Characters never added to a high score name
+NAME_SKIP_CHARS = frozenset(('\r', '\n', '\t'))
+
 # Audio settings
 SOUND_ENABLED = True
 MUSIC_VOLUME = 0.3
 SFX_VOLUME = 0.5
+SOUND_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.snake_sounds')
+SOUND_CACHE_VERSION = 1  # Bump when the synthesis code changes so old WAVs are ignored
+
+@lru_cache(maxsize=None)
+def cell_tile(color):
+    """Get a cached one-cell tile filled with color and a black border"""
+    # Built on first use, once the display mode is set, so it can be converted
+    tile = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+    tile.fill(color)
+    pygame.draw.rect(tile, BLACK, tile.get_rect(), 1)
+    return tile
+
+@lru_cache(maxsize=256)
+def render_cached(font, text, color):
+    """Render antialiased text, reusing the surface for repeated (font, text, color)"""
+    return font.render(text, True, color).convert_alpha()
+
+def blit_batch(target, blit_sequence):
+    """Blit a sequence of (surface, position) pairs onto target in one call"""
+    if HAS_FBLITS:
+        target.fblits(blit_sequence)
+    else:
+        target.blits(blit_sequence, doreturn=0)
 
 class Snake:
+    # Fixed attribute set, so instances skip the per-object __dict__
+    __slots__ = ('positions', '_pos_set', 'dirty_cells', 'free_cells', 'dir_idx', 'grow')
+    
     def __init__(self):
         """Initialize the snake"""
-        self.positions = [(CELL_WIDTH // 2, CELL_HEIGHT // 2)]  # Start in center
-        self.direction = (1, 0)  # Start moving right
+        self.positions = deque()
+        self._pos_set = set()  # Same cells, for fast lookups
+        self.dirty_cells = set()  # Cells that changed since the snake was last drawn
+        self.free_cells = set(ALL_CELLS)  # Cells food can spawn on
+        self.reset()
+    
+    def reset(self):
+        """Put the snake back at its starting state, reusing its containers"""
+        # Only the cells the snake covered need handing back to free_cells
+        self.free_cells |= self._pos_set
+        self.positions.clear()
+        self._pos_set.clear()
+        self.dirty_cells.clear()
+        
+        start = (CELL_WIDTH // 2, CELL_HEIGHT // 2)  # Start in center
+        self.positions.append(start)
+        self._pos_set.add(start)
+        self.free_cells.discard(start)
+        self.dir_idx = 0  # Start moving right
         self.grow = False
+    
+    @property
+    def direction(self):
+        """Current direction as a (dx, dy) tuple"""
+        return DIRS[self.dir_idx]
         
     def move(self):
         """Move the snake in the current direction"""
-        head_x, head_y = self.positions[0]
-        dx, dy = self.direction
-        new_head = (head_x + dx, head_y + dy)
+        head = self.positions[0]
+        dx, dy = DIRS[self.dir_idx]
+        new_x = head[0] + dx
+        new_y = head[1] + dy
         
-        # Check wall collision
-        if (new_head[0] < 0 or new_head[0] >= CELL_WIDTH or
-            new_head[1] < 0 or new_head[1] >= CELL_HEIGHT):
+        # Check wall collision on the raw coordinates, before building a tuple
+        if not (0 <= new_x < CELL_WIDTH and 0 <= new_y < CELL_HEIGHT):
             return False  # Game over
         
         # Check self collision
-        if new_head in self.positions:
+        new_head = (new_x, new_y)
+        if new_head in self._pos_set:
             return False  # Game over
         
-        self.positions.insert(0, new_head)
+        self.dirty_cells.add(head)  # Old head becomes body
+        self.positions.appendleft(new_head)
+        self._pos_set.add(new_head)
+        self.free_cells.discard(new_head)
+        self.dirty_cells.add(new_head)
         
         # Remove tail unless growing
         if not self.grow:
-            self.positions.pop()
+            tail = self.positions.pop()
+            self._pos_set.discard(tail)
+            self.free_cells.add(tail)
+            self.dirty_cells.add(tail)
         else:
             self.grow = False
             
         return True
     
+    def __contains__(self, cell):
+        """Check if the snake occupies cell, in constant time"""
+        return cell in self._pos_set
+    
     def change_direction(self, new_direction):
         """Change snake direction, preventing 180-degree turns"""
-        dx, dy = self.direction
-        new_dx, new_dy = new_direction
-        
+        self.turn(DIR_INDEX[new_direction])
+    
+    def turn(self, new_idx):
+        """Turn to the direction at index new_idx of DIRS, preventing 180-degree turns"""
         # Prevent moving in opposite direction
-        if (dx, dy) != (-new_dx, -new_dy):
-            self.direction = new_direction
+        if (self.dir_idx ^ new_idx) != 2:
+            self.dir_idx = new_idx
     
     def grow_snake(self):
         """Make the snake grow on next move"""
@@ -98,21 +212,28 @@ class Snake:
     
     def draw(self, screen):
         """Draw the snake on the screen"""
-        for i, (x, y) in enumerate(self.positions):
-            rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-            # Head is brighter green, body is darker green
-            color = GREEN if i == 0 else DARK_GREEN
-            pygame.draw.rect(screen, color, rect)
-            # Add border to snake segments
-            pygame.draw.rect(screen, BLACK, rect, 1)
+        # Head is brighter green, body is darker green
+        head_tile = cell_tile(GREEN)
+        body_tile = cell_tile(DARK_GREEN)
+        head_x, head_y = self.positions[0]
+        blit_list = [(head_tile, (head_x * CELL_SIZE, head_y * CELL_SIZE))]
+        blit_list.extend((body_tile, (x * CELL_SIZE, y * CELL_SIZE)) for x, y in islice(self.positions, 1, None))
+        # Uses Surface.fblits where pygame-ce provides it
+        blit_batch(screen, blit_list)
 
 class Food:
-    def __init__(self, snake_positions):
+    __slots__ = ('position',)
+    
+    def __init__(self, snake_positions, free_cells=None):
         """Initialize food at a random position not occupied by snake"""
-        self.position = self.generate_position(snake_positions)
+        self.position = self.generate_position(snake_positions, free_cells)
     
-    def generate_position(self, snake_positions):
+    def generate_position(self, snake_positions, free_cells=None):
         """Generate a random position for food"""
+        if free_cells is not None:
+            # Pick straight from the empty cells, no retries as the snake grows
+            return random.choice(tuple(free_cells))
+        # Only needs `in`, so snake_positions can be a Snake or a list of cells
         while True:
             x = random.randint(0, CELL_WIDTH - 1)
             y = random.randint(0, CELL_HEIGHT - 1)
@@ -122,16 +243,16 @@ class Food:
     def draw(self, screen):
         """Draw the food on the screen"""
         x, y = self.position
-        rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        pygame.draw.rect(screen, RED, rect)
-        # Add a small border
-        pygame.draw.rect(screen, BLACK, rect, 1)
+        screen.blit(cell_tile(RED), (x * CELL_SIZE, y * CELL_SIZE))
 
 class HighScoreManager:
+    __slots__ = ('filename', 'high_scores', 'unsaved_changes')
+    
     def __init__(self, filename=HIGHSCORE_FILE):
         """Initialize high score manager"""
         self.filename = filename
         self.high_scores = self.load_high_scores()
+        self.unsaved_changes = False
     
     def load_high_scores(self):
         """Load high scores from file"""
@@ -145,6 +266,9 @@ class HighScoreManager:
                         for score in scores:
                             if 'name' not in score:
                                 score['name'] = 'Anonymous'
+                            score['_display'] = f"{score['score']:,} points - {score['name']}"
+                        # Keep highest first so the lowest score is always last
+                        scores.sort(key=lambda x: x['score'], reverse=True)
                         return scores
             except (json.JSONDecodeError, KeyError):
                 pass
@@ -154,14 +278,25 @@ class HighScoreManager:
     def save_high_scores(self):
         """Save high scores to file"""
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(self.high_scores, f, indent=2)
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated high score file behind
+            temp_filename = self.filename + '.tmp'
+            with open(temp_filename, 'w') as f:
+                # Keys starting with "_" are display caches, not saved data
+                json.dump([{k: v for k, v in entry.items() if not k.startswith('_')} for entry in self.high_scores], f, indent=2)
+            os.replace(temp_filename, self.filename)
+            self.unsaved_changes = False
         except Exception as e:
             print(f"Error saving high scores: {e}")
     
+    def save_if_changed(self):
+        """Save high scores to file only if they changed since the last save"""
+        if self.unsaved_changes:
+            self.save_high_scores()
+    
     def add_score(self, score, name="Anonymous"):
         """Add a new score and return True if it's a high score"""
-        is_high_score = len(self.high_scores) < 5 or score > min(s['score'] for s in self.high_scores)
+        is_high_score = len(self.high_scores) < 5 or score > self.high_scores[-1]['score']
         
         if is_high_score:
             # Add new score with name and timestamp
@@ -170,11 +305,15 @@ class HighScoreManager:
                 'name': name[:12],  # Limit name to 12 characters
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M')
             }
-            self.high_scores.append(new_score)
-            # Sort by score (highest first) and keep only top 5
-            self.high_scores.sort(key=lambda x: x['score'], reverse=True)
-            self.high_scores = self.high_scores[:5]
-            self.save_high_scores()
+            # Formatted once here so the high scores screen never re-formats it
+            new_score['_display'] = f"{score:,} points - {new_score['name']}"
+            # The list is kept highest first, so insert in place (after any
+            # equal scores, as the old stable sort did) and drop the 6th
+            keys = [-entry['score'] for entry in self.high_scores]
+            self.high_scores.insert(bisect_right(keys, -score), new_score)
+            del self.high_scores[5:]
+            # Written out when the game exits, not in the middle of a frame
+            self.unsaved_changes = True
         
         return is_high_score
     
@@ -184,7 +323,7 @@ class HighScoreManager:
     
     def is_high_score(self, score):
         """Check if score would be a high score"""
-        return len(self.high_scores) < 5 or score > min(s['score'] for s in self.high_scores)
+        return len(self.high_scores) < 5 or score > self.high_scores[-1]['score']
 
 class AudioManager:
     def __init__(self):
@@ -193,16 +332,22 @@ class AudioManager:
         self.music_volume = MUSIC_VOLUME
         self.sfx_volume = SFX_VOLUME
         self.sounds = {}
+        self.background_sound = None
+        # Generate audio on a worker thread so the game window opens straight away
+        self._ready = threading.Event()
+        threading.Thread(target=self._init_sounds, daemon=True).start()
+    
+    def _init_sounds(self):
+        """Generate all sounds and start the music, then mark audio as ready"""
         self.generate_sounds()
         self.start_background_music()
+        self._ready.set()
     
     def generate_sounds(self):
         """Generate sound effects programmatically"""
         if not HAS_NUMPY:
-            print("Warning: NumPy not available - audio disabled")
-            self.sound_enabled = False
-            return
-            
+            print("Warning: NumPy not available - generating sounds in pure Python")
+        
         try:
             # Food eat sound - upward chirp
             eat_sound = self.create_tone_sequence([
@@ -238,30 +383,55 @@ class AudioManager:
     
     def create_tone_sequence(self, notes):
         """Create a sequence of tones"""
-        if not HAS_NUMPY:
-            return None
-            
-        sample_rate = 22050
+        sample_rate = pygame.mixer.get_init()[0]  # Match the mixer so pitch is right
+        cache_path = self.sound_cache_path('tone', notes, sample_rate)
+        sound = self.load_cached_sound(cache_path)
+        if sound:
+            sound.set_volume(self.sfx_volume)
+            return sound
+        
         total_duration = sum(duration for _, duration in notes)
         total_frames = int(sample_rate * total_duration)
+        fade_frames = sample_rate * 0.01
         
-        # Create stereo sound array using numpy
-        sound_array = np.zeros((total_frames, 2), dtype=np.int16)
-        
-        frame_pos = 0
-        for frequency, duration in notes:
-            frames = int(sample_rate * duration)
-            for i in range(frames):
-                if frame_pos + i < total_frames:
+        if HAS_NUMPY:
+            # Create stereo sound array using numpy
+            sound_array = np.zeros((total_frames, 2), dtype=np.int16)
+            
+            frame_pos = 0
+            for frequency, duration in notes:
+                frames = min(int(sample_rate * duration), total_frames - frame_pos)
+                # Generate the whole note at once: sine wave with fade in/out
+                i = np.arange(frames)
+                t = i / sample_rate
+                fade = np.clip(np.minimum(i, frames - i) / fade_frames, 0.0, 1.0)
+                samples = (fade * 16000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+                sound_array[frame_pos:frame_pos + frames] = samples[:, np.newaxis]
+                frame_pos += frames
+            
+            self.save_cached_sound(cache_path, sound_array.astype('<i2').tobytes(), sample_rate)
+            
+            # Convert to pygame sound
+            sound = pygame.sndarray.make_sound(sound_array)
+        else:
+            # Interleaved left/right samples, written as two plain ints per frame
+            buf = array.array('h', [0]) * (total_frames * 2)
+            
+            frame_pos = 0
+            for frequency, duration in notes:
+                frames = min(int(sample_rate * duration), total_frames - frame_pos)
+                for i in range(frames):
                     # Generate sine wave with fade in/out
                     t = i / sample_rate
-                    fade = min(1.0, min(i / (sample_rate * 0.01), (frames - i) / (sample_rate * 0.01)))
+                    fade = min(1.0, i / fade_frames, (frames - i) / fade_frames)
                     amplitude = int(fade * 16000 * math.sin(2 * math.pi * frequency * t))
-                    sound_array[frame_pos + i] = [amplitude, amplitude]
-            frame_pos += frames
+                    buf[2 * (frame_pos + i)] = amplitude
+                    buf[2 * (frame_pos + i) + 1] = amplitude
+                frame_pos += frames
+            
+            self.save_cached_sound(cache_path, self.little_endian_bytes(buf), sample_rate)
+            sound = pygame.mixer.Sound(buffer=buf)
         
-        # Convert to pygame sound
-        sound = pygame.sndarray.make_sound(sound_array)
         sound.set_volume(self.sfx_volume)
         return sound
     
@@ -276,43 +446,107 @@ class AudioManager:
                 (392, 0.5), (330, 0.5), (392, 1.0)
             ]
             
-            background_music = self.create_background_melody(notes)
             # Note: pygame.mixer.music is better for long music files,
             # but for our generated music, we'll use a different approach
             self.background_channel = pygame.mixer.Channel(0)
+            pygame.mixer.set_reserved(1)  # Keep sound effects off the music channel
+            self.background_sound = self.create_background_melody(notes)
+            if self.background_sound and self.sound_enabled:
+                # Synthesized once, then looped forever by the mixer
+                self.background_channel.play(self.background_sound, loops=-1)
             
         except Exception as e:
             print(f"Warning: Could not create background music: {e}")
     
     def create_background_melody(self, notes):
         """Create background melody"""
-        if not HAS_NUMPY:
-            return None
-            
-        sample_rate = 22050
+        sample_rate = pygame.mixer.get_init()[0]  # Match the mixer so pitch is right
+        cache_path = self.sound_cache_path('melody', notes, sample_rate)
+        sound = self.load_cached_sound(cache_path)
+        if sound:
+            sound.set_volume(self.music_volume)
+            return sound
+        
         total_duration = sum(duration for _, duration in notes)
         total_frames = int(sample_rate * total_duration)
         
-        # Create stereo sound array using numpy
-        sound_array = np.zeros((total_frames, 2), dtype=np.int16)
-        
-        frame_pos = 0
-        for frequency, duration in notes:
-            frames = int(sample_rate * duration)
-            for i in range(frames):
-                if frame_pos + i < total_frames:
-                    t = i / sample_rate
+        if HAS_NUMPY:
+            # Create stereo sound array using numpy
+            sound_array = np.zeros((total_frames, 2), dtype=np.int16)
+            
+            frame_pos = 0
+            for frequency, duration in notes:
+                frames = min(int(sample_rate * duration), total_frames - frame_pos)
+                t = np.arange(frames) / sample_rate
+                # Soft sine wave for background
+                samples = (8000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+                sound_array[frame_pos:frame_pos + frames] = samples[:, np.newaxis]
+                frame_pos += frames
+            
+            self.save_cached_sound(cache_path, sound_array.astype('<i2').tobytes(), sample_rate)
+            sound = pygame.sndarray.make_sound(sound_array)
+        else:
+            # Interleaved left/right samples, written as two plain ints per frame
+            buf = array.array('h', [0]) * (total_frames * 2)
+            
+            frame_pos = 0
+            for frequency, duration in notes:
+                frames = min(int(sample_rate * duration), total_frames - frame_pos)
+                for i in range(frames):
                     # Soft sine wave for background
-                    amplitude = int(8000 * math.sin(2 * math.pi * frequency * t))
-                    sound_array[frame_pos + i] = [amplitude, amplitude]
-            frame_pos += frames
+                    amplitude = int(8000 * math.sin(2 * math.pi * frequency * i / sample_rate))
+                    buf[2 * (frame_pos + i)] = amplitude
+                    buf[2 * (frame_pos + i) + 1] = amplitude
+                frame_pos += frames
+            
+            self.save_cached_sound(cache_path, self.little_endian_bytes(buf), sample_rate)
+            sound = pygame.mixer.Sound(buffer=buf)
         
-        sound = pygame.sndarray.make_sound(sound_array)
         sound.set_volume(self.music_volume)
         return sound
     
+    def sound_cache_path(self, kind, notes, sample_rate):
+        """Get the WAV cache file for a generated sound"""
+        # Keyed on the notes, and on the cache version for synthesis changes
+        key = hashlib.md5(repr((SOUND_CACHE_VERSION, kind, notes, sample_rate)).encode()).hexdigest()[:12]
+        return os.path.join(SOUND_CACHE_DIR, f"{kind}-{key}.wav")
+    
+    def load_cached_sound(self, path):
+        """Load a sound generated on an earlier run, or None if not cached"""
+        if os.path.exists(path):
+            try:
+                return pygame.mixer.Sound(path)
+            except pygame.error:
+                pass  # Unreadable file, generate it again
+        return None
+    
+    def little_endian_bytes(self, buf):
+        """Get the raw bytes of a 16-bit sample array in WAV (little-endian) order"""
+        if sys.byteorder == 'big':
+            buf = array.array('h', buf)
+            buf.byteswap()
+        return buf.tobytes()
+    
+    def save_cached_sound(self, path, sample_bytes, sample_rate):
+        """Save a generated stereo 16-bit sound so later runs can skip synthesis"""
+        try:
+            os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated WAV to be loaded on later runs
+            temp_path = path + '.tmp'
+            with wave.open(temp_path, 'wb') as wav_file:
+                wav_file.setnchannels(2)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(sample_rate)
+                wav_file.writeframes(sample_bytes)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not cache sound: {e}")
+    
     def play_sound(self, sound_name):
         """Play a sound effect"""
+        if not self._ready.is_set():
+            return  # Still being generated
         if self.sound_enabled and sound_name in self.sounds:
             try:
                 self.sounds[sound_name].play()
@@ -324,23 +558,41 @@ class AudioManager:
         self.sound_enabled = not self.sound_enabled
         if not self.sound_enabled:
             pygame.mixer.stop()
+        elif self.background_sound:
+            self.background_channel.play(self.background_sound, loops=-1)
         return self.sound_enabled
     
     def adjust_music_volume(self, change):
         """Adjust music volume"""
         self.music_volume = max(0.0, min(1.0, self.music_volume + change))
+        if self.background_sound:
+            self.background_sound.set_volume(self.music_volume)
         return self.music_volume
     
     def adjust_sfx_volume(self, change):
         """Adjust sound effects volume"""
         self.sfx_volume = max(0.0, min(1.0, self.sfx_volume + change))
-        for sound in self.sounds.values():
+        for sound in list(self.sounds.values()):  # May still be filling on the worker thread
             sound.set_volume(self.sfx_volume)
         return self.sfx_volume
 
 class Game:
+    __slots__ = (
+        'screen', 'clock', 'font', 'large_font', 'medium_font', 'small_font', 'grid_surface',
+        '_instruction_surfs', '_max_speed_surf', '_sound_status_surfs', '_pause_surf', '_resume_surf',
+        '_game_over_surf', '_new_high_surf', '_restart_surf', '_control_surfs', '_rank_prefix_surfs', '_rank_gap',
+        'high_score_manager', 'audio_manager', 'snake', 'food', 'score', 'game_over', 'paused',
+        'show_high_scores', 'new_high_score', 'entering_name', 'player_name', 'name_cursor_visible',
+        'cursor_timer', 'show_audio_settings', 'last_speed_level',
+        '_playfield_drawn', '_drawn_food', '_drawn_hud_key', '_hud_rects', '_drawn_screen_key', '_drawn_name_key',
+        '_cached_top_score', '_best_score_surf', '_highscore_panel', '_highscore_panel_key'
+    )
+    
     def __init__(self):
         """Initialize the game"""
+        # Start sound generation first (it only needs the mixer) so its worker
+        # thread runs while the window, fonts and cached text are set up
+        self.audio_manager = AudioManager()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Snake Game - Use Arrow Keys to Play!")
         self.clock = pygame.time.Clock()
@@ -348,8 +600,42 @@ class Game:
         self.large_font = pygame.font.Font(None, 72)
         self.medium_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 24)
+        
+        # Pre-render the static background grid once
+        self.grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.grid_surface.fill(BLACK)
+        for x in range(0, WINDOW_WIDTH, CELL_SIZE):
+            pygame.draw.line(self.grid_surface, GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)
+        for y in range(0, WINDOW_HEIGHT, CELL_SIZE):
+            pygame.draw.line(self.grid_surface, GRAY, (0, y), (WINDOW_WIDTH, y), 1)
+        
+        # Pre-render text that never changes so draw() only blits it,
+        # converted to the display format so each blit skips conversion
+        self._instruction_surfs = [
+            self.small_font.render(instruction, True, WHITE).convert_alpha()
+            for instruction in ("Arrow Keys: Move", "Space: Pause", "M: Audio Settings", "ESC: Quit")
+        ]
+        self._max_speed_surf = self.small_font.render("Maximum speed reached!", True, YELLOW).convert_alpha()
+        self._sound_status_surfs = {
+            True: self.small_font.render("Sound: ♪", True, YELLOW).convert_alpha(),
+            False: self.small_font.render("Sound: ♪̸", True, GRAY).convert_alpha()
+        }
+        self._pause_surf = self.large_font.render("PAUSED", True, YELLOW).convert_alpha()
+        self._resume_surf = self.font.render("Press SPACE to resume", True, WHITE).convert_alpha()
+        self._game_over_surf = self.large_font.render("GAME OVER", True, RED).convert_alpha()
+        self._new_high_surf = self.medium_font.render("🎉 NEW HIGH SCORE! 🎉", True, YELLOW).convert_alpha()
+        self._restart_surf = self.font.render("Press SPACE to play again", True, WHITE).convert_alpha()
+        self._control_surfs = [
+            self.small_font.render(text, True, WHITE).convert_alpha()
+            for text in ("Press H for High Scores | M for Audio Settings", "ESC to quit")
+        ]
+        self._rank_prefix_surfs = {
+            rank: self.font.render(text, True, color).convert_alpha()
+            for rank, (text, color) in RANK_STYLES.items()
+        }
+        self._rank_gap = self.font.size(" ")[0]
+        
         self.high_score_manager = HighScoreManager()
-        self.audio_manager = AudioManager()
         self.show_high_scores = False
         self.new_high_score = False
         self.entering_name = False
@@ -358,13 +644,27 @@ class Game:
         self.cursor_timer = 0
         self.show_audio_settings = False
         self.last_speed_level = 1
+        # State of the last full/incremental playfield draw
+        self._playfield_drawn = False
+        self._drawn_food = None
+        self._drawn_hud_key = None
+        self._hud_rects = []
+        # What the current menu/pause screen and name input box were drawn from
+        self._drawn_screen_key = None
+        self._drawn_name_key = None
+        # Best score shown on the game over screen, refreshed when scores change
+        self._cached_top_score = []
+        self._best_score_surf = None
+        # Composited high score rows and the scores they were built from
+        self._highscore_panel = None
+        self._highscore_panel_key = None
         self.reset_game()
     
     def reset_game(self):
         """Reset the game to initial state"""
         global CURRENT_FPS
         self.snake = Snake()
-        self.food = Food(self.snake.positions)
+        self.food = Food(self.snake, self.snake.free_cells)
         self.score = 0
         self.game_over = False
         self.paused = False
@@ -376,11 +676,22 @@ class Game:
         self.last_speed_level = 1
         CURRENT_FPS = INITIAL_FPS  # Reset speed to initial slow speed
     
+    def refresh_best_score(self):
+        """Re-read the best score and pre-render its game over line"""
+        self._cached_top_score = self.high_score_manager.get_top_scores(1)
+        if self._cached_top_score:
+            best = self._cached_top_score[0]
+            self._best_score_surf = self.small_font.render(f"Best Score: {best['score']} by {best['name']}", True, YELLOW).convert_alpha()
+    
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # The window contents may be lost, so repaint everything
+                self._playfield_drawn = False
+                self._drawn_screen_key = None
             elif event.type == pygame.KEYDOWN:
                 if self.game_over:
                     if self.entering_name:
@@ -389,6 +700,7 @@ class Game:
                             # Submit the name
                             name = self.player_name.strip() if self.player_name.strip() else "Anonymous"
                             self.high_score_manager.add_score(self.score, name)
+                            self.refresh_best_score()
                             self.entering_name = False
                             self.new_high_score = True
                             # Play high score celebration sound again
@@ -399,13 +711,16 @@ class Game:
                         elif event.key == pygame.K_ESCAPE:
                             # Cancel name entry, use Anonymous
                             self.high_score_manager.add_score(self.score, "Anonymous")
+                            self.refresh_best_score()
                             self.entering_name = False
                             self.new_high_score = True
                         elif len(self.player_name) < 12:  # Limit name length
                             # Add character to name
-                            if event.unicode.isprintable() and event.unicode not in ['\r', '\n']:
+                            if event.unicode and event.unicode.isprintable() and event.unicode not in NAME_SKIP_CHARS:
                                 self.player_name += event.unicode
                     else:
+                        if self.show_audio_settings and self.handle_audio_settings_key(event):
+                            continue
                         if event.key == pygame.K_SPACE:
                             if self.show_high_scores:
                                 self.show_high_scores = False
@@ -418,63 +733,50 @@ class Game:
                         elif event.key == pygame.K_ESCAPE:
                             return False
                 else:
-                    if event.key == pygame.K_UP:
-                        self.snake.change_direction((0, -1))
-                    elif event.key == pygame.K_DOWN:
-                        self.snake.change_direction((0, 1))
-                    elif event.key == pygame.K_LEFT:
-                        self.snake.change_direction((-1, 0))
-                    elif event.key == pygame.K_RIGHT:
-                        self.snake.change_direction((1, 0))
+                    if event.key in DIRECTION_MAP:
+                        self.snake.turn(DIRECTION_MAP[event.key])
                     elif event.key == pygame.K_SPACE:
                         self.paused = not self.paused
                     elif event.key == pygame.K_m:
                         self.show_audio_settings = not self.show_audio_settings
-                    elif event.key == pygame.K_s and self.show_audio_settings:
-                        enabled = self.audio_manager.toggle_sound()
-                        print(f"Sound {'enabled' if enabled else 'disabled'}")
-                    elif event.key == pygame.K_UP and self.show_audio_settings:
-                        if pygame.key.get_pressed()[pygame.K_LSHIFT]:
-                            vol = self.audio_manager.adjust_sfx_volume(0.1)
-                            print(f"SFX Volume: {vol:.1f}")
-                        else:
-                            vol = self.audio_manager.adjust_music_volume(0.1)
-                            print(f"Music Volume: {vol:.1f}")
-                    elif event.key == pygame.K_DOWN and self.show_audio_settings:
-                        if pygame.key.get_pressed()[pygame.K_LSHIFT]:
-                            vol = self.audio_manager.adjust_sfx_volume(-0.1)
-                            print(f"SFX Volume: {vol:.1f}")
-                        else:
-                            vol = self.audio_manager.adjust_music_volume(-0.1)
-                            print(f"Music Volume: {vol:.1f}")
                     elif event.key == pygame.K_ESCAPE:
                         return False
+                    elif self.show_audio_settings:
+                        self.handle_audio_settings_key(event)
         return True
     
+    def handle_audio_settings_key(self, event):
+        """Handle an audio settings key press, returning True if it was used"""
+        if event.key == pygame.K_s:
+            enabled = self.audio_manager.toggle_sound()
+            print(f"Sound {'enabled' if enabled else 'disabled'}")
+            return True
+        
+        volume_key = VOLUME_KEY_MAP.get((event.key, bool(event.mod & pygame.KMOD_SHIFT)))
+        if volume_key:
+            method, label, change = volume_key
+            vol = getattr(self.audio_manager, method)(change)
+            print(f"{label} Volume: {vol:.1f}")
+            return True
+        return False
+    
     def update(self):
         """Update game state"""
         if not self.game_over and not self.paused:
             # Move snake
             if not self.snake.move():
-                self.game_over = True
-                # Play game over sound
-                self.audio_manager.play_sound('game_over')
-                
-                # Check if it's a potential high score
-                if self.high_score_manager.is_high_score(self.score):
-                    self.entering_name = True
-                    self.player_name = ""
-                    self.new_high_score = False  # Will be set to True after name entry
-                    self.audio_manager.play_sound('high_score')
-                else:
-                    self.new_high_score = False
+                self.end_game()
                 return
             
             # Check if snake ate food
             if self.snake.positions[0] == self.food.position:
                 self.snake.grow_snake()
                 self.score += 10
-                self.food = Food(self.snake.positions)
+                if not self.snake.free_cells:
+                    # The snake fills the whole board, so there is nowhere left for food
+                    self.end_game()
+                    return
+                self.food = Food(self.snake, self.snake.free_cells)
                 
                 # Play eat sound
                 self.audio_manager.play_sound('eat')
@@ -492,55 +794,66 @@ class Game:
                 
                 CURRENT_FPS = min(MAX_FPS, INITIAL_FPS + speed_increase)
     
+    def end_game(self):
+        """Switch to the game over screen, starting name entry for a high score"""
+        self.game_over = True
+        self.refresh_best_score()
+        # Play game over sound
+        self.audio_manager.play_sound('game_over')
+        
+        # Check if it's a potential high score
+        if self.high_score_manager.is_high_score(self.score):
+            self.entering_name = True
+            self.player_name = ""
+            self.new_high_score = False  # Will be set to True after name entry
+            self.audio_manager.play_sound('high_score')
+        else:
+            self.new_high_score = False
+    
     def draw(self):
         """Draw everything on the screen"""
-        # Clear screen
-        self.screen.fill(BLACK)
-        
         # Update cursor blink timer
         self.cursor_timer += 1
         if self.cursor_timer >= 30:  # Blink every 30 frames
             self.name_cursor_visible = not self.name_cursor_visible
             self.cursor_timer = 0
         
-        # Draw grid (optional, for visual appeal)
-        for x in range(0, WINDOW_WIDTH, CELL_SIZE):
-            pygame.draw.line(self.screen, GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)
-        for y in range(0, WINDOW_HEIGHT, CELL_SIZE):
-            pygame.draw.line(self.screen, GRAY, (0, y), (WINDOW_WIDTH, y), 1)
+        if self._playfield_drawn and not self.game_over and not self.paused:
+            # Snake and food only change a few cells per move, so just
+            # redraw those and push only them to the display
+            dirty = self.draw_playfield_changes()
+            if dirty:
+                pygame.display.update(dirty)
+            return
+        
+        # Pause and game over screens are static, so only repaint them when
+        # what they show changes (the name input box is handled on its own)
+        screen_key = self.static_screen_key()
+        if screen_key is not None and screen_key == self._drawn_screen_key:
+            if self.entering_name and self.name_input_key() != self._drawn_name_key:
+                pygame.display.update(self.draw_name_input())
+            return
+        
+        # Clear screen and draw grid (optional, for visual appeal)
+        self.screen.blit(self.grid_surface, (0, 0))
         
         if not self.game_over:
             # Draw snake and food
             self.snake.draw(self.screen)
             self.food.draw(self.screen)
+            self.snake.dirty_cells.clear()
+            self._drawn_food = self.food.position
             
-            # Draw score
-            score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-            self.screen.blit(score_text, (10, 10))
-            
-            # Draw speed and level
-            speed_level = (CURRENT_FPS - INITIAL_FPS) + 1
-            speed_text = self.font.render(f"Speed: {CURRENT_FPS} (Level {speed_level})", True, WHITE)
-            self.screen.blit(speed_text, (10, 50))
-            
-            # Draw next speed up indicator
-            points_needed = 30 - (self.score % 30)
-            if CURRENT_FPS < MAX_FPS:
-                next_speed_text = pygame.font.Font(None, 24).render(f"Next speed up in {points_needed} points", True, YELLOW)
-                self.screen.blit(next_speed_text, (10, 85))
-            else:
-                max_speed_text = pygame.font.Font(None, 24).render("Maximum speed reached!", True, YELLOW)
-                self.screen.blit(max_speed_text, (10, 85))
+            # Draw score, speed, instructions and audio status
+            self._hud_rects = self.draw_hud()
             
             if self.paused:
                 # Draw pause message
-                pause_text = self.large_font.render("PAUSED", True, YELLOW)
-                pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-                self.screen.blit(pause_text, pause_rect)
+                pause_rect = self._pause_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+                self.screen.blit(self._pause_surf, pause_rect)
                 
-                resume_text = self.font.render("Press SPACE to resume", True, WHITE)
-                resume_rect = resume_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
-                self.screen.blit(resume_text, resume_rect)
+                resume_rect = self._resume_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
+                self.screen.blit(self._resume_surf, resume_rect)
         else:
             if self.entering_name:
                 # Draw name entry screen
@@ -555,64 +868,131 @@ class Game:
                 # Draw game over screen
                 y_offset = -80 if self.new_high_score else -50
                 
-                game_over_text = self.large_font.render("GAME OVER", True, RED)
-                game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + y_offset))
-                self.screen.blit(game_over_text, game_over_rect)
+                game_over_rect = self._game_over_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + y_offset))
+                self.screen.blit(self._game_over_surf, game_over_rect)
                 
                 # Show new high score message if applicable
                 if self.new_high_score:
-                    new_high_text = self.medium_font.render("🎉 NEW HIGH SCORE! 🎉", True, YELLOW)
-                    new_high_rect = new_high_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40))
-                    self.screen.blit(new_high_text, new_high_rect)
+                    new_high_rect = self._new_high_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40))
+                    self.screen.blit(self._new_high_surf, new_high_rect)
                 
-                final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+                final_score_text = render_cached(self.font, f"Final Score: {self.score}", WHITE)
                 final_score_rect = final_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
                 self.screen.blit(final_score_text, final_score_rect)
                 
                 # Show current high score
-                top_scores = self.high_score_manager.get_top_scores(1)
-                if top_scores:
-                    best_score_text = self.small_font.render(f"Best Score: {top_scores[0]['score']} by {top_scores[0]['name']}", True, YELLOW)
-                    best_score_rect = best_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30))
-                    self.screen.blit(best_score_text, best_score_rect)
+                if self._cached_top_score:
+                    best_score_rect = self._best_score_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30))
+                    self.screen.blit(self._best_score_surf, best_score_rect)
                 
-                restart_text = self.font.render("Press SPACE to play again", True, WHITE)
-                restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
-                self.screen.blit(restart_text, restart_rect)
+                restart_rect = self._restart_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
+                self.screen.blit(self._restart_surf, restart_rect)
                 
-                controls_text = [
-                    "Press H for High Scores | M for Audio Settings",
-                    "ESC to quit"
-                ]
-                for i, text in enumerate(controls_text):
-                    control_text = self.small_font.render(text, True, WHITE)
+                for i, control_text in enumerate(self._control_surfs):
                     control_rect = control_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 90 + i * 20))
                     self.screen.blit(control_text, control_rect)
         
+        # Incremental drawing can take over from the next frame while playing
+        self._playfield_drawn = not self.game_over and not self.paused
+        self._drawn_screen_key = screen_key
+        pygame.display.flip()
+    
+    def static_screen_key(self):
+        """Return what the current pause/game over screen depends on, or None while playing"""
+        if not self.game_over:
+            if not self.paused:
+                return None
+            return ('paused', self.audio_manager.sound_enabled)
+        if self.entering_name:
+            return ('name', self.score)
+        if self.show_audio_settings:
+            audio = self.audio_manager
+            return ('audio', audio.sound_enabled, audio.music_volume, audio.sfx_volume)
+        if self.show_high_scores:
+            # Scores are only added from the name entry screen, so leaving
+            # it already changes the key
+            return ('scores',)
+        return ('game_over', self.score, self.new_high_score)
+    
+    def name_input_key(self):
+        """Return the text currently shown in the name input box"""
+        return (self.player_name, self.name_cursor_visible and len(self.player_name) < 12)
+    
+    def draw_hud(self):
+        """Draw the in-game text overlay and return the rects it covers"""
+        rects = []
+        
+        # Draw score
+        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        rects.append(self.screen.blit(score_text, (10, 10)))
+        
+        # Draw speed and level
+        speed_level = (CURRENT_FPS - INITIAL_FPS) + 1
+        speed_text = self.font.render(f"Speed: {CURRENT_FPS} (Level {speed_level})", True, WHITE)
+        rects.append(self.screen.blit(speed_text, (10, 50)))
+        
+        # Draw next speed up indicator
+        points_needed = 30 - (self.score % 30)
+        if CURRENT_FPS < MAX_FPS:
+            next_speed_text = self.small_font.render(f"Next speed up in {points_needed} points", True, YELLOW)
+            rects.append(self.screen.blit(next_speed_text, (10, 85)))
+        else:
+            rects.append(self.screen.blit(self._max_speed_surf, (10, 85)))
+        
         # Draw instructions
-        if not self.game_over and not self.paused:
-            instructions = [
-                "Arrow Keys: Move",
-                "Space: Pause",
-                "M: Audio Settings",
-                "ESC: Quit"
-            ]
-            for i, instruction in enumerate(instructions):
-                text = pygame.font.Font(None, 24).render(instruction, True, WHITE)
-                self.screen.blit(text, (WINDOW_WIDTH - 150, 10 + i * 25))
+        if not self.paused:
+            for i, text in enumerate(self._instruction_surfs):
+                rects.append(self.screen.blit(text, (WINDOW_WIDTH - 150, 10 + i * 25)))
         
         # Draw audio status indicator
-        if not self.game_over:
-            sound_status = "♪" if self.audio_manager.sound_enabled else "♪̸"
-            sound_text = self.small_font.render(f"Sound: {sound_status}", True, YELLOW if self.audio_manager.sound_enabled else GRAY)
-            self.screen.blit(sound_text, (10, WINDOW_HEIGHT - 30))
+        sound_text = self._sound_status_surfs[self.audio_manager.sound_enabled]
+        rects.append(self.screen.blit(sound_text, (10, WINDOW_HEIGHT - 30)))
         
-        pygame.display.flip()
+        self._drawn_hud_key = (self.score, CURRENT_FPS, self.audio_manager.sound_enabled)
+        return rects
+    
+    def draw_cell(self, cell):
+        """Redraw one grid cell with whatever occupies it and return its rect"""
+        x, y = cell
+        rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+        if cell == self.snake.positions[0]:
+            self.screen.blit(cell_tile(GREEN), rect)
+        elif cell in self.snake:
+            self.screen.blit(cell_tile(DARK_GREEN), rect)
+        elif cell == self.food.position:
+            self.food.draw(self.screen)
+        else:
+            self.screen.blit(self.grid_surface, rect, rect)
+        return rect
+    
+    def draw_playfield_changes(self):
+        """Redraw only what changed since the last frame and return the dirty rects"""
+        cells = self.snake.dirty_cells
+        if self.food.position != self._drawn_food:
+            cells.add(self.food.position)
+            self._drawn_food = self.food.position
+        hud_key = (self.score, CURRENT_FPS, self.audio_manager.sound_enabled)
+        if not cells and hud_key == self._drawn_hud_key:
+            return []
+        
+        dirty = [self.draw_cell(cell) for cell in cells]
+        cells.clear()
+        
+        # Redraw the HUD if its text changed or a cell was drawn over it
+        if hud_key != self._drawn_hud_key or any(rect.collidelist(self._hud_rects) != -1 for rect in dirty):
+            for rect in self._hud_rects:
+                # Restore whatever was under the old text first
+                for x in range(rect.left // CELL_SIZE, min(CELL_WIDTH, (rect.right - 1) // CELL_SIZE + 1)):
+                    for y in range(rect.top // CELL_SIZE, min(CELL_HEIGHT, (rect.bottom - 1) // CELL_SIZE + 1)):
+                        dirty.append(self.draw_cell((x, y)))
+            self._hud_rects = self.draw_hud()
+            dirty.extend(self._hud_rects)
+        return dirty
     
     def draw_audio_settings_screen(self):
         """Draw the audio settings screen"""
         # Title
-        title_text = self.large_font.render("♪ AUDIO SETTINGS ♪", True, YELLOW)
+        title_text = render_cached(self.large_font, "♪ AUDIO SETTINGS ♪", YELLOW)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 120))
         self.screen.blit(title_text, title_rect)
         
@@ -625,7 +1005,7 @@ class Game:
         ]
         
         for setting in settings:
-            setting_text = self.font.render(setting, True, WHITE)
+            setting_text = render_cached(self.font, setting, WHITE)
             setting_rect = setting_text.get_rect(center=(WINDOW_WIDTH // 2, y_pos))
             self.screen.blit(setting_text, setting_rect)
             y_pos += 40
@@ -641,34 +1021,53 @@ class Game:
         ]
         
         for control in controls:
-            control_text = self.small_font.render(control, True, WHITE)
+            control_text = render_cached(self.small_font, control, WHITE)
             control_rect = control_text.get_rect(center=(WINDOW_WIDTH // 2, y_pos))
             self.screen.blit(control_text, control_rect)
             y_pos += 30
         
         # Test sound button hint
         test_hint = "Move in-game to test sound effects!"
-        test_text = self.small_font.render(test_hint, True, GRAY)
+        test_text = render_cached(self.small_font, test_hint, GRAY)
         test_rect = test_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
         self.screen.blit(test_text, test_rect)
     
     def draw_name_entry_screen(self):
         """Draw the name entry screen"""
         # Title
-        title_text = self.large_font.render("🎉 NEW HIGH SCORE! 🎉", True, YELLOW)
+        title_text = render_cached(self.large_font, "🎉 NEW HIGH SCORE! 🎉", YELLOW)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(title_text, title_rect)
         
         # Score
-        score_text = self.font.render(f"Score: {self.score:,} points", True, WHITE)
+        score_text = render_cached(self.font, f"Score: {self.score:,} points", WHITE)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(score_text, score_rect)
         
         # Instructions
-        instruction_text = self.font.render("Enter your name:", True, WHITE)
+        instruction_text = render_cached(self.font, "Enter your name:", WHITE)
         instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, 250))
         self.screen.blit(instruction_text, instruction_rect)
         
+        self.draw_name_input()
+        
+        # Controls
+        controls = [
+            "ENTER: Submit name",
+            "BACKSPACE: Delete character",
+            "ESC: Use 'Anonymous'"
+        ]
+        
+        for i, control in enumerate(controls):
+            control_text = render_cached(self.small_font, control, WHITE)
+            control_rect = control_text.get_rect(center=(WINDOW_WIDTH // 2, 380 + i * 25))
+            self.screen.blit(control_text, control_rect)
+    
+    def draw_name_input(self):
+        """Draw the name input box and character count, returning the rect they cover"""
+        # Restore the background first since the text width changes
+        self.screen.blit(self.grid_surface, NAME_INPUT_RECT, NAME_INPUT_RECT)
+        
         # Name input box
         input_box = pygame.Rect(WINDOW_WIDTH // 2 - 150, 290, 300, 50)
         pygame.draw.rect(self.screen, WHITE, input_box, 2)
@@ -687,90 +1086,103 @@ class Game:
         
         # Character limit indicator
         char_count = f"{len(self.player_name)}/12"
-        char_text = self.small_font.render(char_count, True, GRAY)
+        char_text = render_cached(self.small_font, char_count, GRAY)
         self.screen.blit(char_text, (input_box.right - 50, input_box.bottom + 5))
         
-        # Controls
-        controls = [
-            "ENTER: Submit name",
-            "BACKSPACE: Delete character",
-            "ESC: Use 'Anonymous'"
-        ]
-        
-        for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, WHITE)
-            control_rect = control_text.get_rect(center=(WINDOW_WIDTH // 2, 380 + i * 25))
-            self.screen.blit(control_text, control_rect)
+        self._drawn_name_key = self.name_input_key()
+        return [NAME_INPUT_RECT]
     
     def draw_high_scores_screen(self):
         """Draw the high scores screen"""
+        # Everything is rendered first, then blitted in one batch call
+        blit_sequence = []
+        
         # Title
-        title_text = self.large_font.render("🏆 HIGH SCORES 🏆", True, YELLOW)
+        title_text = render_cached(self.large_font, "🏆 HIGH SCORES 🏆", YELLOW)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title_text, title_rect)
+        blit_sequence.append((title_text, title_rect))
         
-        # Get top scores
+        # The score rows only change when a new high score is added, so
+        # they are composited onto one panel and rebuilt only then
         top_scores = self.high_score_manager.get_top_scores(5)
+        panel_key = tuple((s['_display'], s['date']) for s in top_scores)
+        if panel_key != self._highscore_panel_key:
+            self._highscore_panel = self.build_highscore_panel(top_scores)
+            self._highscore_panel_key = panel_key
+        blit_sequence.append((self._highscore_panel, HIGHSCORE_PANEL_RECT))
+        
+        # Instructions
+        back_text = render_cached(self.font, "Press SPACE to go back", WHITE)
+        back_rect = back_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80))
+        blit_sequence.append((back_text, back_rect))
+        
+        play_again_text = render_cached(self.small_font, "Press ESC to quit game", WHITE)
+        play_again_rect = play_again_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
+        blit_sequence.append((play_again_text, play_again_rect))
+        
+        blit_batch(self.screen, blit_sequence)
+    
+    def build_highscore_panel(self, top_scores):
+        """Render the high score rows onto a copy of the background behind them"""
+        panel = self.grid_surface.subsurface(HIGHSCORE_PANEL_RECT).copy()
+        top = HIGHSCORE_PANEL_RECT.top
+        blit_sequence = []
         
         if not top_scores:
-            no_scores_text = self.font.render("No high scores yet!", True, WHITE)
-            no_scores_rect = no_scores_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
-            self.screen.blit(no_scores_text, no_scores_rect)
+            no_scores_text = render_cached(self.font, "No high scores yet!", WHITE)
+            no_scores_rect = no_scores_text.get_rect(center=(WINDOW_WIDTH // 2, 200 - top))
+            blit_sequence.append((no_scores_text, no_scores_rect))
             
-            play_text = self.font.render("Play a game to set the first score!", True, WHITE)
-            play_rect = play_text.get_rect(center=(WINDOW_WIDTH // 2, 240))
-            self.screen.blit(play_text, play_rect)
+            play_text = render_cached(self.font, "Play a game to set the first score!", WHITE)
+            play_rect = play_text.get_rect(center=(WINDOW_WIDTH // 2, 240 - top))
+            blit_sequence.append((play_text, play_rect))
         else:
-            # Draw scores
-            start_y = 180
             for i, score_data in enumerate(top_scores):
                 rank = i + 1
-                score = score_data['score']
-                name = score_data.get('name', 'Anonymous')
                 date = score_data['date']
                 
-                # Rank and score
-                if rank == 1:
-                    color = YELLOW  # Gold for first place
-                    rank_text = f"🥇 {rank}."
-                elif rank == 2:
-                    color = WHITE   # Silver for second
-                    rank_text = f"🥈 {rank}."
-                elif rank == 3:
-                    color = (205, 127, 50)  # Bronze for third
-                    rank_text = f"🥉 {rank}."
-                else:
-                    color = WHITE
-                    rank_text = f"   {rank}."
+                # Rank (pre-rendered) followed by score and name
+                rank_text = self._rank_prefix_surfs[rank]
+                blit_sequence.append((rank_text, (120, i * 50)))
                 
-                score_line = f"{rank_text} {score:,} points - {name}"
-                score_text = self.font.render(score_line, True, color)
-                self.screen.blit(score_text, (120, start_y + i * 50))
+                score_text = render_cached(self.font, score_data['_display'], RANK_STYLES[rank][1])
+                score_x = 120 + rank_text.get_width() + self._rank_gap
+                blit_sequence.append((score_text, (score_x, i * 50)))
                 
                 # Date
-                date_text = self.small_font.render(date, True, GRAY)
-                self.screen.blit(date_text, (120, start_y + i * 50 + 25))
+                date_text = render_cached(self.small_font, date, GRAY)
+                blit_sequence.append((date_text, (120, i * 50 + 25)))
         
-        # Instructions
-        back_text = self.font.render("Press SPACE to go back", True, WHITE)
-        back_rect = back_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80))
-        self.screen.blit(back_text, back_rect)
-        
-        play_again_text = self.small_font.render("Press ESC to quit game", True, WHITE)
-        play_again_rect = play_again_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
-        self.screen.blit(play_again_text, play_again_rect)
+        blit_batch(panel, blit_sequence)
+        return panel
     
     def run(self):
         """Main game loop"""
         print("🐍 Snake Game Started!")
         print("Use arrow keys to move, SPACE to pause, ESC to quit")
         
+        # Bind the per-frame methods to locals to skip attribute lookups each frame
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        tick = self.clock.tick
+        
         running = True
-        while running:
-            running = self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(CURRENT_FPS)
+        lag = 0.0
+        try:
+            while running:
+                running = handle_events()
+                # Run as many fixed-length moves as the elapsed time calls
+                # for, so speed doesn't depend on how often frames are drawn.
+                # The step is read once so a speed-up applies from next frame
+                step = 1 / CURRENT_FPS
+                while lag >= step:
+                    update()
+                    lag -= step
+                draw()
+                lag = min(lag + tick(RENDER_FPS) / 1000, MAX_CATCHUP_MOVES / CURRENT_FPS)
+        finally:
+            self.high_score_manager.save_if_changed()
         
         pygame.quit()
         sys.exit()
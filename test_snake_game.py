@@ -11,21 +11,27 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from snake_game import Snake, Food, HighScoreManager, CELL_WIDTH, CELL_HEIGHT
+    from snake_game import Game, Snake, Food, HighScoreManager, CELL_WIDTH, CELL_HEIGHT
 except ImportError:
     print("Warning: Could not import game modules. Make sure pygame and numpy are installed.")
-    Snake = Food = HighScoreManager = None
+    Game = Snake = Food = HighScoreManager = None
     CELL_WIDTH = CELL_HEIGHT = 40  # Default values for testing
 
 
 class TestSnake(unittest.TestCase):
     """Test Snake class functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one snake shared by every test"""
+        if Snake is None:
+            raise unittest.SkipTest("Snake class not available")
+        cls.snake = Snake()
+    
     def setUp(self):
         """Set up test fixtures"""
-        if Snake is None:
-            self.skipTest("Snake class not available")
-        self.snake = Snake()
+        # Cheaper than building a new Snake for each test
+        self.snake.reset()
     
     def test_snake_initialization(self):
         """Test snake starts in correct position"""
@@ -54,6 +60,23 @@ class TestSnake(unittest.TestCase):
         self.snake.change_direction((0, 1))  # Down (opposite of up)
         self.assertEqual(self.snake.direction, (0, -1))  # Should stay up
     
+    def test_turn_by_index(self):
+        """Test turning by direction index"""
+        self.snake.turn(1)  # Down
+        self.assertEqual(self.snake.direction, (0, 1))
+        
+        # Reverse turn (up) should be ignored
+        self.snake.turn(3)
+        self.assertEqual(self.snake.direction, (0, 1))
+    
+    def test_snake_contains(self):
+        """Test membership checks follow the snake as it moves"""
+        start = self.snake.positions[0]
+        self.assertIn(start, self.snake)
+        self.snake.move()
+        self.assertNotIn(start, self.snake)
+        self.assertIn(self.snake.positions[0], self.snake)
+    
     def test_snake_growth(self):
         """Test snake growing mechanism"""
         initial_length = len(self.snake.positions)
@@ -64,6 +87,21 @@ class TestSnake(unittest.TestCase):
         self.snake.move()
         self.assertEqual(len(self.snake.positions), initial_length + 1)
         self.assertFalse(self.snake.grow)  # Grow flag should reset
+    
+    def test_snake_reset(self):
+        """Test reset restores the starting state after moving and growing"""
+        self.snake.grow_snake()
+        self.snake.turn(1)
+        self.snake.move()
+        self.snake.move()
+        
+        self.snake.reset()
+        fresh = Snake()
+        self.assertEqual(self.snake.positions, fresh.positions)
+        self.assertEqual(self.snake.free_cells, fresh.free_cells)
+        self.assertEqual(self.snake.direction, (1, 0))
+        self.assertFalse(self.snake.grow)
+        self.assertFalse(self.snake.dirty_cells)
 
 
 class TestFood(unittest.TestCase):
@@ -93,6 +131,18 @@ class TestFood(unittest.TestCase):
         self.assertGreaterEqual(y, 0)
         self.assertLess(x, CELL_WIDTH)
         self.assertLess(y, CELL_HEIGHT)
+    
+    def test_food_from_free_cells(self):
+        """Test food spawns on one of the given free cells"""
+        free_cells = {(0, 0), (5, 7)}
+        food = Food(self.snake_positions, free_cells)
+        self.assertIn(food.position, free_cells)
+    
+    def test_food_avoids_snake_object(self):
+        """Test food accepts a Snake without a free cell set"""
+        snake = Snake()
+        food = Food(snake)
+        self.assertNotIn(food.position, snake)
 
 
 class TestHighScoreManager(unittest.TestCase):
@@ -126,6 +176,27 @@ class TestHighScoreManager(unittest.TestCase):
         self.assertEqual(scores[0]['score'], 100)
         self.assertEqual(scores[0]['name'], "TestPlayer")
     
+    def test_deferred_save(self):
+        """Test scores are only written to disk when saved"""
+        self.manager.add_score(100, "TestPlayer")
+        self.assertFalse(os.path.exists(self.test_file))
+        
+        self.manager.save_if_changed()
+        self.assertFalse(os.path.exists(self.test_file + '.tmp'))
+        reloaded = HighScoreManager(self.test_file)
+        self.assertEqual(reloaded.get_top_scores()[0]['score'], 100)
+    
+    def test_display_line_not_saved(self):
+        """Test the cached display line is rebuilt on load instead of saved"""
+        self.manager.add_score(1500, "TestPlayer")
+        self.assertEqual(self.manager.get_top_scores()[0]['_display'], "1,500 points - TestPlayer")
+        
+        self.manager.save_if_changed()
+        with open(self.test_file) as f:
+            self.assertNotIn('_display', f.read())
+        reloaded = HighScoreManager(self.test_file)
+        self.assertEqual(reloaded.get_top_scores()[0]['_display'], "1,500 points - TestPlayer")
+    
     def test_is_high_score(self):
         """Test high score detection"""
         # Empty list - any score is high
@@ -150,6 +221,43 @@ class TestHighScoreManager(unittest.TestCase):
         self.assertEqual(len(scores), 5)  # Should only keep 5
         self.assertEqual(scores[0]['score'], 100)  # Highest first
         self.assertEqual(scores[-1]['score'], 60)  # 5th highest
+    
+    def test_scores_stay_sorted(self):
+        """Test scores added out of order end up highest first"""
+        for score in [30, 90, 10, 90, 50]:
+            self.manager.add_score(score, f"Player{score}")
+        self.manager.add_score(70, "Late")
+        
+        scores = [s['score'] for s in self.manager.get_top_scores()]
+        self.assertEqual(scores, [90, 90, 70, 50, 30])
+
+
+class TestGame(unittest.TestCase):
+    """Test Game update logic"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        if Game is None:
+            self.skipTest("Game class not available")
+        self.game = Game()
+    
+    def test_filling_board_ends_game(self):
+        """Test eating the last free cell ends the game instead of placing food"""
+        snake = self.game.snake
+        last_cell = (1, 0)
+        head = (0, 0)  # Moving right into the last free cell
+        body = [(x, y) for x in range(CELL_WIDTH) for y in range(CELL_HEIGHT) if (x, y) not in (head, last_cell)]
+        snake.positions.clear()
+        snake.positions.extend([head] + body)
+        snake._pos_set = set(snake.positions)
+        snake.free_cells = {last_cell}
+        snake.grow = True
+        self.game.food.position = last_cell
+        
+        self.game.update()
+        self.assertTrue(self.game.game_over)
+        self.assertEqual(self.game.snake.positions[0], last_cell)
+        self.assertFalse(self.game.snake.free_cells)
 
 
 class TestGameConstants(unittest.TestCase):
@@ -169,10 +277,9 @@ def run_tests():
     suite = unittest.TestSuite()
     
     # Add test cases
-    suite.addTest(unittest.makeSuite(TestSnake))
-    suite.addTest(unittest.makeSuite(TestFood))
-    suite.addTest(unittest.makeSuite(TestHighScoreManager))
-    suite.addTest(unittest.makeSuite(TestGameConstants))
+    loader = unittest.TestLoader()
+    suite.addTests(loader.loadTestsFromTestCase(test_class)
+                   for test_class in (TestSnake, TestFood, TestHighScoreManager, TestGame, TestGameConstants))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)